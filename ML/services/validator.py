@@ -1,11 +1,15 @@
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
-from geopy.distance import geodesic
+from sklearn.cluster import DBSCAN
+from collections import defaultdict
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 from models.rescue_report import RescueReport
 import re
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz, process
+
+EARTH_RADIUS_METERS = 6371000
+DISASTER_KEYWORDS = ["earthquake", "flood", "wildfire", "tornado", "hurricane", "landslide", "collapse", "spill"]
 
 class ReportValidator:
     def __init__(self):
@@ -20,80 +24,111 @@ class ReportValidator:
             "Building collapse in commercial district",
             "Chemical spill in industrial zone"
         ]
+        self._news_lower = [news.lower() for news in self.latest_disaster_news]
+        # Types that do not count as a fake indicator; "storm" and "other" are accepted but still flagged
+        self._valid_types = frozenset({"flood", "earthquake", "fire", "tornado", "hurricane", "landslide", "collapse", "spill"})
+        
+        # Keyword -> index of the first news item mentioning it, scanned with one compiled pattern
+        self._keyword_news = {}
+        for index, news in enumerate(self._news_lower):
+            for keyword in DISASTER_KEYWORDS:
+                if keyword in news:
+                    self._keyword_news.setdefault(keyword, index)
+        # Whole words only, allowing plural/verb endings ("floods", "flooding") but not "floodlight"
+        alternation = "|".join(map(re.escape, self._keyword_news)) or "(?!)"
+        self._keyword_pattern = re.compile(r"\b(" + alternation + r")(?:s|es|ed|ing)?\b")
+        
+        # Reports repeating the same text (common within one offline sync) reuse their news match
+        self._match_report_text = lru_cache(maxsize=8192)(self._match_report_text)
     
     def cluster_reports_by_location(self, reports: List[RescueReport]) -> Dict[str, List[RescueReport]]:
-        """Cluster reports based on geospatial coordinates using K-Means"""
+        """Cluster reports lying within 50 meters of each other using DBSCAN on haversine distance"""
         if len(reports) < 2:
             return {f"incident_1": reports}
         
-        # Extract coordinates
-        coordinates = [(report.location_lat, report.location_lng) for report in reports]
-        
-        # Determine optimal number of clusters based on proximity
-        n_clusters = self._estimate_optimal_clusters(coordinates)
-        
-        # Apply K-Means clustering
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-        cluster_labels = kmeans.fit_predict(coordinates)
+        cluster_labels = self._cluster_labels(
+            np.array([report.location_lat for report in reports]),
+            np.array([report.location_lng for report in reports])
+        )
         
         # Group reports by cluster
-        clustered_reports = {}
-        for i, label in enumerate(cluster_labels):
-            incident_id = f"incident_{label + 1}"
-            if incident_id not in clustered_reports:
-                clustered_reports[incident_id] = []
-            clustered_reports[incident_id].append(reports[i])
+        clustered_reports = defaultdict(list)
+        for report, label in zip(reports, cluster_labels):
+            clustered_reports[f"incident_{label + 1}"].append(report)
         
-        return clustered_reports
+        return dict(clustered_reports)
+    
+    def _cluster_labels(self, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """DBSCAN cluster label per coordinate, numbered in order of first appearance"""
+        if len(lats) < 2:
+            return np.zeros(len(lats), dtype=int)
+        
+        # Haversine metric expects [lat, lng] in radians; eps is the radius as an angle
+        coordinates = np.radians(np.column_stack((lats, lngs)))
+        dbscan = DBSCAN(
+            eps=self.radius_meters / EARTH_RADIUS_METERS,
+            min_samples=1,
+            metric="haversine",
+            algorithm="ball_tree"
+        )
+        return dbscan.fit_predict(coordinates)
+    
+    def _report_queries(self, report: RescueReport) -> List[str]:
+        """Lowercased title and description used as similarity queries"""
+        return [report.title.lower(), (report.description or "").lower()]
+    
+    def _similarity_matrix(self, queries: List[str], workers: int = 1) -> np.ndarray:
+        """Score every query against every news item in one RapidFuzz call (0-1 scale)"""
+        return process.cdist(queries, self._news_lower, scorer=fuzz.ratio, workers=workers) / 100.0
+    
+    def _match_news(self, queries: List[List[str]], workers: int = 1) -> List[Tuple[float, Optional[str]]]:
+        """Best (similarity, news item) per report; a disaster keyword hit skips fuzzy scoring"""
+        # Score each distinct (title, description) pair only once
+        unique_queries = list(dict.fromkeys(tuple(report_queries) for report_queries in queries))
+        if len(unique_queries) < len(queries):
+            unique_matches = dict(zip(unique_queries, self._match_news(unique_queries, workers)))
+            return [unique_matches[tuple(report_queries)] for report_queries in queries]
+        
+        matches = [None] * len(queries)
+        misses = []
+        for i, report_queries in enumerate(queries):
+            keyword = self._keyword_pattern.search(" ".join(report_queries))
+            if keyword:
+                matches[i] = (1.0, self.latest_disaster_news[self._keyword_news[keyword.group(1)]])
+            else:
+                misses.append(i)
+        
+        if misses:
+            # Reports without a keyword are scored together in a single RapidFuzz call
+            similarities = self._similarity_matrix([query for i in misses for query in queries[i]], workers)
+            for row, i in enumerate(misses):
+                report_similarities = similarities[2 * row:2 * row + 2]
+                best_index = int(report_similarities.argmax())
+                max_similarity = float(report_similarities.flat[best_index])
+                matching_news = self.latest_disaster_news[best_index % len(self._news_lower)] if max_similarity > 0 else None
+                matches[i] = (max_similarity, matching_news)
+        
+        return matches
     
-    def _estimate_optimal_clusters(self, coordinates: List[Tuple[float, float]]) -> int:
-        """Estimate optimal number of clusters based on 50-meter proximity"""
-        if len(coordinates) <= 2:
-            return 1
-        
-        # Simple heuristic: count distinct groups within 50m radius
-        visited = [False] * len(coordinates)
-        clusters = 0
-        
-        for i, coord1 in enumerate(coordinates):
-            if not visited[i]:
-                clusters += 1
-                visited[i] = True
-                
-                # Find all coordinates within 50m of this one
-                for j, coord2 in enumerate(coordinates):
-                    if i != j and not visited[j]:
-                        distance = geodesic(coord1, coord2).meters
-                        if distance <= self.radius_meters:
-                            visited[j] = True
-        
-        return clusters
+    def _match_report_text(self, title_lower: str, description_lower: str) -> Tuple[float, Optional[str]]:
+        """Best news match for a single report's text (memoized per validator in __init__)"""
+        return self._match_news([[title_lower, description_lower]])[0]
     
     def validate_report_authenticity(self, report: RescueReport) -> Dict[str, any]:
         """Validate report against latest disaster news to flag potential fake reports"""
-        title_lower = report.title.lower()
-        description_lower = (report.description or "").lower()
-        
-        # Check for similarity with known disaster news
-        max_similarity = 0
-        matching_news = None
-        
-        for news in self.latest_disaster_news:
-            news_lower = news.lower()
-            
-            # Calculate similarity for title
-            title_similarity = SequenceMatcher(None, title_lower, news_lower).ratio()
-            
-            # Calculate similarity for description
-            desc_similarity = SequenceMatcher(None, description_lower, news_lower).ratio()
-            
-            # Take the maximum similarity
-            overall_similarity = max(title_similarity, desc_similarity)
-            
-            if overall_similarity > max_similarity:
-                max_similarity = overall_similarity
-                matching_news = news
-        
+        max_similarity, matching_news = self._match_report_text(*self._report_queries(report))
+        return self._score_report(report, max_similarity, matching_news)
+    
+    def validate_batch_authenticity(self, reports: List[RescueReport]) -> List[Dict[str, any]]:
+        """Validate a batch of reports, matching all of them against the news in one call"""
+        matches = self._match_news([self._report_queries(report) for report in reports], workers=-1)
+        return [
+            self._score_report(report, max_similarity, matching_news)
+            for report, (max_similarity, matching_news) in zip(reports, matches)
+        ]
+    
+    def _score_report(self, report: RescueReport, max_similarity: float, matching_news: Optional[str]) -> Dict[str, any]:
+        """Combine a report's best news match with the fake report heuristics"""
         # Determine if report is likely authentic
         is_likely_authentic = max_similarity >= 0.3  # 30% similarity threshold
         
@@ -101,7 +136,7 @@ class ReportValidator:
         fake_indicators = [
             len(report.title) < 10,  # Very short titles
             len(report.needs) == 0,   # No specified needs
-            report.disaster_type.lower() not in ["flood", "earthquake", "fire", "tornado", "hurricane", "landslide", "collapse", "spill"]
+            report.disaster_type not in self._valid_types
         ]
         
         fake_score = sum(fake_indicators) / len(fake_indicators)
@@ -115,38 +150,42 @@ class ReportValidator:
         }
     
     def process_batch_reports(self, reports: List[RescueReport]) -> Dict[str, any]:
-        """Process a batch of reports: cluster them and validate authenticity"""
+        """Process a batch of already validated reports: cluster them and summarize each incident"""
+        # Read each field once into flat arrays; all aggregates below are array slices
+        n_reports = len(reports)
+        lats = np.fromiter((r.location_lat for r in reports), dtype=float, count=n_reports)
+        lngs = np.fromiter((r.location_lng for r in reports), dtype=float, count=n_reports)
+        priorities = np.fromiter((r.priority for r in reports), dtype=int, count=n_reports)
+        
         # Cluster reports by location
-        clustered_reports = self.cluster_reports_by_location(reports)
+        cluster_labels = self._cluster_labels(lats, lngs)
+        
+        # Authenticity comes from validate_batch_authenticity, already applied as is_verified
+        authentic = np.fromiter((r.is_verified for r in reports), dtype=bool, count=n_reports)
         
-        # Validate each report
-        validation_results = {}
-        for report in reports:
-            validation_results[report.id] = self.validate_report_authenticity(report)
+        # Group report indices by cluster and generate incident summary
+        order = np.argsort(cluster_labels, kind="stable")
+        groups = np.split(order, np.flatnonzero(np.diff(cluster_labels[order])) + 1) if n_reports else []
         
-        # Generate incident summary
+        clustered_reports = {}
         incident_summary = {}
-        for incident_id, incident_reports in clustered_reports.items():
-            authentic_reports = [
-                report for report in incident_reports 
-                if validation_results[report.id]["is_likely_authentic"]
-            ]
-            
+        for indices in groups:
+            incident_id = f"incident_{cluster_labels[indices[0]] + 1}"
+            clustered_reports[incident_id] = [reports[i] for i in indices]
             incident_summary[incident_id] = {
-                "total_reports": len(incident_reports),
-                "authentic_reports": len(authentic_reports),
-                "priority": max([r.priority for r in incident_reports], default=1),
-                "disaster_types": list(set([r.disaster_type for r in incident_reports])),
+                "total_reports": len(indices),
+                "authentic_reports": int(authentic[indices].sum()),
+                "priority": int(priorities[indices].max()),
+                "disaster_types": list({reports[i].disaster_type for i in indices}),
                 "location": {
-                    "lat": np.mean([r.location_lat for r in incident_reports]),
-                    "lng": np.mean([r.location_lng for r in incident_reports])
+                    "lat": lats[indices].mean(),
+                    "lng": lngs[indices].mean()
                 }
             }
         
         return {
             "clustered_reports": clustered_reports,
-            "validation_results": validation_results,
             "incident_summary": incident_summary,
-            "total_reports_processed": len(reports),
+            "total_reports_processed": n_reports,
             "total_incidents": len(clustered_reports)
         }
@@ -1,4 +1,5 @@
 from .reports import router as reports_router
 from .admin import router as admin_router
+from .responses import FastJSONResponse
 
-__all__ = ["reports_router", "admin_router"]
+__all__ = ["reports_router", "admin_router", "FastJSONResponse"]
@@ -1,23 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select, func
-from typing import List, Dict, Any
-from collections import defaultdict
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Dict, Any, Optional
+import asyncio
 
 from models.database import get_db
-from models.rescue_report import RescueReport
+from models.rescue_report import Need, RescueReport
+from models.repository import array_contains, assign_incident_ids, aggregate_incidents, top_reports_by_incident
 from ML.services.validator import ReportValidator
-from schemas.report_schemas import DashboardResponse, IncidentSummary, ReportResponse
+from .dashboard_cache import dashboard_cache
+from .responses import json_response
+from schemas.report_schemas import (
+    DashboardResponse,
+    IncidentSummary,
+    ReportResponse,
+    RESPONSE_ADAPTER,
+    REPORT_LIST_ADAPTER,
+    INCIDENT_ADAPTER,
+    DASHBOARD_ADAPTER
+)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 validator = ReportValidator()
 
+def _incident_summary(row: Any, reports: List[RescueReport]) -> IncidentSummary:
+    """Build an incident summary from an aggregate_incidents row and its reports"""
+    return IncidentSummary.model_construct(
+        incident_id=row.incident_id,
+        total_reports=row.total_reports,
+        authentic_reports=row.total_reports,  # All verified reports are considered authentic
+        priority=row.priority,
+        disaster_types=row.disaster_types,
+        location={"lat": row.lat, "lng": row.lng},
+        reports=[ReportResponse.from_orm_fast(report) for report in reports]
+    )
+
 @router.get("/reports/pending", response_model=List[ReportResponse])
 async def list_pending_reports(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    need: Optional[Need] = None,
+    # Geohash base32 alphabet (no a, i, l, o); a full geohash is 9 characters here
+    geohash_prefix: Optional[str] = Query(None, min_length=1, max_length=9, pattern="^[0-9b-hjkmnp-z]+$"),
+    db: AsyncSession = Depends(get_db)
 ):
-    """List reports waiting for NGO/admin verification."""
+    """List reports waiting for NGO/admin verification, optionally filtered by need and area."""
     try:
         query = (
             select(RescueReport)
@@ -26,8 +53,16 @@ async def list_pending_reports(
             .limit(limit)
             .order_by(RescueReport.timestamp.desc())
         )
-        reports = db.exec(query).all()
-        return [ReportResponse.from_orm(report) for report in reports]
+        if need:
+            # needs @> ARRAY[need], served by the GIN index
+            query = query.where(array_contains(RescueReport.needs, need))
+        if geohash_prefix:
+            # Left-anchored LIKE on the geohash index selects every report inside that cell
+            query = query.where(RescueReport.geohash.startswith(geohash_prefix, autoescape=True))
+        reports = (await db.exec(query)).all()
+        return json_response(REPORT_LIST_ADAPTER.dump_json(
+            [ReportResponse.from_orm_fast(report) for report in reports]
+        ))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -38,11 +73,11 @@ async def list_pending_reports(
 async def update_report_verification_status(
     report_id: int,
     is_verified: bool,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update report verification status (verified or unverified)."""
     try:
-        report = db.get(RescueReport, report_id)
+        report = await db.get(RescueReport, report_id)
         if not report:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -51,78 +86,80 @@ async def update_report_verification_status(
 
         report.is_verified = is_verified
         db.add(report)
-        db.commit()
-        db.refresh(report)
-        return ReportResponse.from_orm(report)
+        await db.commit()
+        await dashboard_cache.invalidate()
+        # Sessions keep attributes loaded after commit, so no refresh SELECT is needed
+        return json_response(RESPONSE_ADAPTER.dump_json(ReportResponse.from_orm_fast(report)))
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update report verification status: {str(e)}"
         )
 
 @router.get("/dashboard", response_model=DashboardResponse)
-async def get_dashboard(db: Session = Depends(get_db)):
-    """Get NGO dashboard with verified and clustered reports"""
+async def get_dashboard(
+    limit: int = Query(50, ge=1, le=200),
+    reports_per_incident: int = Query(20, ge=0, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get NGO dashboard with verified and clustered reports, highest priority incidents first"""
     try:
-        verified_reports_query = select(RescueReport).where(RescueReport.is_verified == True)
-        verified_reports = db.exec(verified_reports_query).all()
+        # Served straight from Redis until the next report write
+        cache_key = await dashboard_cache.key(limit=limit, reports_per_incident=reports_per_incident)
+        cached = await dashboard_cache.get(cache_key)
+        if cached is not None:
+            return json_response(cached)
+        
+        # Clustering only needs ids, coordinates and the current incident id, not full report rows
+        verified_locations = (await db.exec(
+            select(RescueReport.id, RescueReport.location_lat, RescueReport.location_lng, RescueReport.incident_id)
+            .where(RescueReport.is_verified == True)
+        )).all()
         
-        # Get all reports for statistics
-        all_reports = db.exec(select(RescueReport)).all()
+        # Count all reports for statistics
+        total_reports = (await db.exec(select(func.count(RescueReport.id)))).one()
         
-        if not verified_reports:
-            return DashboardResponse(
+        if not verified_locations:
+            body = DASHBOARD_ADAPTER.dump_json(DashboardResponse.model_construct(
                 incidents=[],
-                total_reports=len(all_reports),
+                total_reports=total_reports,
                 total_incidents=0,
                 verified_reports=0,
-                pending_verification=len(all_reports)
-            )
-        
-        clustered_reports = validator.cluster_reports_by_location(verified_reports)
-        
-        for incident_id, incident_reports in clustered_reports.items():
-            for report in incident_reports:
-                report.incident_id = incident_id
-                db.add(report)
-        db.commit()
-        
-        incidents = []
-        for incident_id, incident_reports in clustered_reports.items():
-            priorities = [r.priority for r in incident_reports]
-            disaster_types = list(set([r.disaster_type for r in incident_reports]))
-            
-            # Calculate center location
-            avg_lat = sum(r.location_lat for r in incident_reports) / len(incident_reports)
-            avg_lng = sum(r.location_lng for r in incident_reports) / len(incident_reports)
-            
-            incident = IncidentSummary(
-                incident_id=incident_id,
-                total_reports=len(incident_reports),
-                authentic_reports=len(incident_reports),  # All verified reports are considered authentic
-                priority=max(priorities) if priorities else 1,
-                disaster_types=disaster_types,
-                location={"lat": avg_lat, "lng": avg_lng},
-                reports=[ReportResponse.from_orm(report) for report in incident_reports]
-            )
-            incidents.append(incident)
-        
-        incidents.sort(key=lambda x: (-x.priority, max(r.timestamp for r in x.reports)))
+                pending_verification=total_reports
+            ))
+            await dashboard_cache.set(cache_key, body)
+            return json_response(body)
+        
+        # Clustering is CPU-bound; keep it off the event loop
+        clustered_reports = await asyncio.to_thread(validator.cluster_reports_by_location, verified_locations)
+        await assign_incident_ids(db, clustered_reports)
+        await db.commit()
+        
+        # Aggregate the requested page of incidents in the database with a single GROUP BY
+        incident_aggregates = await aggregate_incidents(db, limit=limit)
+        reports_by_incident = await top_reports_by_incident(
+            db, [row.incident_id for row in incident_aggregates], reports_per_incident
+        )
+        incidents = [
+            _incident_summary(row, reports_by_incident[row.incident_id])
+            for row in incident_aggregates
+        ]
         
         # statistics
-        total_verified = len(verified_reports)
-        total_pending = len([r for r in all_reports if not r.is_verified])
+        total_verified = len(verified_locations)
         
-        return DashboardResponse(
+        body = DASHBOARD_ADAPTER.dump_json(DashboardResponse.model_construct(
             incidents=incidents,
-            total_reports=len(all_reports),
-            total_incidents=len(incidents),
+            total_reports=total_reports,
+            total_incidents=len(clustered_reports),
             verified_reports=total_verified,
-            pending_verification=total_pending
-        )
+            pending_verification=total_reports - total_verified
+        ))
+        await dashboard_cache.set(cache_key, body)
+        return json_response(body)
         
     except Exception as e:
         raise HTTPException(
@@ -133,36 +170,21 @@ async def get_dashboard(db: Session = Depends(get_db)):
 @router.get("/incidents/{incident_id}", response_model=IncidentSummary)
 async def get_incident_details(
     incident_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get detailed information about a specific incident"""
     try:
-        reports_query = select(RescueReport).where(
-            RescueReport.incident_id == incident_id,
-            RescueReport.is_verified == True
-        )
-        incident_reports = db.exec(reports_query).all()
+        incident_aggregates = await aggregate_incidents(db, incident_id=incident_id)
         
-        if not incident_reports:
+        if not incident_aggregates:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Incident not found"
             )
-        priorities = [r.priority for r in incident_reports]
-        disaster_types = list(set([r.disaster_type for r in incident_reports]))
-        
-        avg_lat = sum(r.location_lat for r in incident_reports) / len(incident_reports)
-        avg_lng = sum(r.location_lng for r in incident_reports) / len(incident_reports)
-        
-        return IncidentSummary(
-            incident_id=incident_id,
-            total_reports=len(incident_reports),
-            authentic_reports=len(incident_reports),
-            priority=max(priorities) if priorities else 1,
-            disaster_types=disaster_types,
-            location={"lat": avg_lat, "lng": avg_lng},
-            reports=[ReportResponse.from_orm(report) for report in incident_reports]
-        )
+        reports_by_incident = await top_reports_by_incident(db, [incident_id])
+        return json_response(INCIDENT_ADAPTER.dump_json(
+            _incident_summary(incident_aggregates[0], reports_by_incident[incident_id])
+        ))
     except HTTPException:
         raise
     except Exception as e:
@@ -172,29 +194,31 @@ async def get_incident_details(
         )
 
 @router.get("/statistics")
-async def get_statistics(db: Session = Depends(get_db)):
+async def get_statistics(db: AsyncSession = Depends(get_db)):
     """Get overall statistics for the platform"""
     try:
-        total_reports = len(db.exec(select(RescueReport)).all())
-        verified_reports = len(db.exec(select(RescueReport).where(RescueReport.is_verified == True)).all())
+        total_reports = (await db.exec(select(func.count(RescueReport.id)))).one()
+        verified_reports = (await db.exec(
+            select(func.count(RescueReport.id)).where(RescueReport.is_verified == True)
+        )).one()
         
-        disaster_type_counts = db.exec(
+        disaster_type_counts = (await db.exec(
             select(RescueReport.disaster_type, func.count(RescueReport.id))
             .group_by(RescueReport.disaster_type)
-        ).all()
+        )).all()
         
-        priority_counts = db.exec(
+        priority_counts = (await db.exec(
             select(RescueReport.priority, func.count(RescueReport.id))
             .where(RescueReport.is_verified == True)
             .group_by(RescueReport.priority)
-        ).all()
+        )).all()
         
         # Recent activity (last 24 hours)
-        from datetime import datetime, timedelta
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        recent_reports = len(db.exec(
-            select(RescueReport).where(RescueReport.timestamp >= yesterday)
-        ).all())
+        from datetime import datetime, timedelta, timezone
+        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+        recent_reports = (await db.exec(
+            select(func.count(RescueReport.id)).where(RescueReport.timestamp >= yesterday)
+        )).one()
         
         return {
             "total_reports": total_reports,
@@ -0,0 +1,65 @@
+import logging
+import os
+from typing import Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "reports:version"
+
+class DashboardCache:
+    """Serialized dashboard responses in Redis, keyed on a version bumped by every report write"""
+
+    def __init__(self, url: Optional[str], ttl_seconds: int = 30):
+        self.ttl_seconds = ttl_seconds
+        self._redis = aioredis.from_url(url) if url else None
+
+    async def key(self, **params) -> Optional[str]:
+        """Cache key for the current report version and these query parameters"""
+        if self._redis is None:
+            return None
+        try:
+            version = await self._redis.get(VERSION_KEY)
+        except RedisError as e:
+            logger.warning(f"Dashboard cache unavailable: {str(e)}")
+            return None
+        # Any write bumps the version, so older keys are never read again and simply expire
+        query = ":".join(f"{name}={value}" for name, value in sorted(params.items()))
+        return f"dashboard:{int(version or 0)}:{query}"
+
+    async def get(self, key: Optional[str]) -> Optional[bytes]:
+        if key is None:
+            return None
+        try:
+            return await self._redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Dashboard cache read failed: {str(e)}")
+            return None
+
+    async def set(self, key: Optional[str], body: bytes) -> None:
+        if key is None:
+            return
+        try:
+            await self._redis.set(key, body, ex=self.ttl_seconds)
+        except RedisError as e:
+            logger.warning(f"Dashboard cache write failed: {str(e)}")
+
+    async def invalidate(self) -> None:
+        """Call after committing report inserts or verification changes"""
+        if self._redis is None:
+            return
+        try:
+            await self._redis.incr(VERSION_KEY)
+        except RedisError as e:
+            logger.warning(f"Dashboard cache invalidation failed: {str(e)}")
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+
+dashboard_cache = DashboardCache(
+    os.getenv("REDIS_URL"),
+    ttl_seconds=int(os.getenv("DASHBOARD_CACHE_TTL", "30"))
+)
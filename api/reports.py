@@ -1,108 +1,151 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Dict, Any, Callable, Type
 from datetime import datetime
+import asyncio
 
+from models import geohash
 from models.database import get_db
 from models.rescue_report import RescueReport, RescueReportCreate
+from models.repository import bulk_insert_reports, assign_incident_ids
 from ML.services.validator import ReportValidator
+from .dashboard_cache import dashboard_cache
+from .responses import json_response
+from .submit_batcher import report_batcher
 from schemas.report_schemas import (
     ReportSubmitRequest,
     BatchSyncRequest,
     ReportResponse,
     BatchSyncResponse,
     DashboardResponse,
-    IncidentSummary
+    IncidentSummary,
+    SUBMIT_ADAPTER,
+    BATCH_ADAPTER,
+    RESPONSE_ADAPTER,
+    BATCH_RESPONSE_ADAPTER
 )
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 validator = ReportValidator()
 
-@router.post("/submit", response_model=ReportResponse, status_code=status.HTTP_201_CREATED)
-async def submit_report(
-    report_data: ReportSubmitRequest,
-    db: Session = Depends(get_db)
-):
+def _json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body for routes that read and validate the raw body themselves"""
+    schema = model.model_json_schema()
+    definitions = schema.pop("$defs", {})
+    
+    # Inline nested model references; "#/$defs/..." would not resolve inside the OpenAPI document
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+    
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}}
+        }
+    }
+
+def _build_report(report_data: ReportSubmitRequest) -> RescueReport:
+    """Create an unsaved RescueReport from a validated submission"""
+    return RescueReport(
+        location_lat=report_data.location_lat,
+        location_lng=report_data.location_lng,
+        disaster_type=report_data.disaster_type,
+        needs=sorted(report_data.needs),
+        priority=report_data.priority,
+        title=report_data.title,
+        description=report_data.description,
+        geohash=geohash.encode(report_data.location_lat, report_data.location_lng)
+    )
+
+async def _validate_json_body(request: Request, validate_json: Callable[[bytes], Any]) -> Any:
+    """Parse and validate the raw request body in a single pydantic-core pass"""
+    try:
+        return validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+@router.post(
+    "/submit",
+    response_model=ReportResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=_json_body_openapi(ReportSubmitRequest)
+)
+async def submit_report(request: Request):
     """Submit a single disaster report"""
+    report_data = await _validate_json_body(request, SUBMIT_ADAPTER.validate_json)
     try:
         # Create report model
-        report = RescueReport(
-            location_lat=report_data.location_lat,
-            location_lng=report_data.location_lng,
-            disaster_type=report_data.disaster_type,
-            needs=report_data.needs,
-            priority=report_data.priority,
-            title=report_data.title,
-            description=report_data.description
-        )
+        report = _build_report(report_data)
         
         validation_result = validator.validate_report_authenticity(report)
         
         if validation_result["is_likely_authentic"]:
             report.is_verified = True
         
-        db.add(report)
-        db.commit()
-        db.refresh(report)
-        return ReportResponse.from_orm(report)
+        # Inserted together with concurrent submissions in one bulk INSERT; the id is set on return
+        await report_batcher.submit(report)
+        return json_response(
+            RESPONSE_ADAPTER.dump_json(ReportResponse.from_orm_fast(report)),
+            status_code=status.HTTP_201_CREATED
+        )
         
     except Exception as e:
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to submit report: {str(e)}"
         )
 
-@router.post("/sync", response_model=BatchSyncResponse)
+@router.post("/sync", response_model=BatchSyncResponse, openapi_extra=_json_body_openapi(BatchSyncRequest))
 async def sync_batch_reports(
-    batch_data: BatchSyncRequest,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_db)
 ):
     """Sync multiple reports for offline-first functionality"""
+    batch_data = await _validate_json_body(request, BATCH_ADAPTER.validate_json)
     try:
-        created_reports = []
-        # Process each report in the batch
-        for report_data in batch_data.reports:
-            report = RescueReport(
-                location_lat=report_data.location_lat,
-                location_lng=report_data.location_lng,
-                disaster_type=report_data.disaster_type,
-                needs=report_data.needs,
-                priority=report_data.priority,
-                title=report_data.title,
-                description=report_data.description
-            )
-            # Validate report authenticity
-            validation_result = validator.validate_report_authenticity(report)
+        created_reports = [_build_report(report_data) for report_data in batch_data.reports]
+        
+        # Fuzzy validation is CPU-bound; score the whole batch at once off the event loop
+        validation_results = await asyncio.to_thread(validator.validate_batch_authenticity, created_reports)
+        for report, validation_result in zip(created_reports, validation_results):
             if validation_result["is_likely_authentic"]:
                 report.is_verified = True
-            
-            db.add(report)
-            created_reports.append(report)
-        db.commit()
         
-        for report in created_reports:
-            db.refresh(report)
+        # Insert the whole batch in one round trip
+        await bulk_insert_reports(db, created_reports)
 
-        batch_result = validator.process_batch_reports(created_reports)
+        # Clustering is CPU-bound; keep it off the event loop
+        batch_result = await asyncio.to_thread(validator.process_batch_reports, created_reports)
         
-        # Update incident IDs for clustered reports
+        # Update incident IDs for clustered reports in a single statement
+        await assign_incident_ids(db, batch_result["clustered_reports"])
         for incident_id, incident_reports in batch_result["clustered_reports"].items():
             for report in incident_reports:
                 report.incident_id = incident_id
-                db.add(report)
-        db.commit()
+        await db.commit()
+        await dashboard_cache.invalidate()
         
-        return BatchSyncResponse(
+        return json_response(BATCH_RESPONSE_ADAPTER.dump_json(BatchSyncResponse.model_construct(
             success=True,
             message=f"Successfully processed {len(created_reports)} reports into {len(batch_result['clustered_reports'])} incidents",
             processed_reports=len(created_reports),
             incidents_created=len(batch_result["clustered_reports"]),
             reports_with_ids=[{"id": r.id, "incident_id": r.incident_id} for r in created_reports]
-        )
+        )))
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to sync reports: {str(e)}"
@@ -111,17 +154,17 @@ async def sync_batch_reports(
 @router.get("/{report_id}", response_model=ReportResponse)
 async def get_report(
     report_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific report by ID"""
     try:
-        report = db.get(RescueReport, report_id)
+        report = await db.get(RescueReport, report_id)
         if not report:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Report not found"
             )
-        return ReportResponse.from_orm(report)
+        return json_response(RESPONSE_ADAPTER.dump_json(ReportResponse.from_orm_fast(report)))
         
     except HTTPException:
         raise
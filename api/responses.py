@@ -0,0 +1,15 @@
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from typing import Any
+
+class FastJSONResponse(ORJSONResponse):
+    """orjson response that passes bytes already serialized by a TypeAdapter through untouched"""
+    
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray)):
+            return bytes(content)
+        return super().render(content)
+
+def json_response(content: bytes, status_code: int = status.HTTP_200_OK) -> FastJSONResponse:
+    """Wrap JSON bytes already serialized by a pydantic-core TypeAdapter"""
+    return FastJSONResponse(content=content, status_code=status_code)
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import os
+from contextlib import suppress
+from typing import List, Optional, Tuple
+
+from models.database import async_session
+from models.rescue_report import RescueReport
+from models.repository import bulk_insert_reports
+from .dashboard_cache import dashboard_cache
+
+logger = logging.getLogger(__name__)
+
+class ReportInsertBatcher:
+    """Coalesce concurrent single-report submissions into one bulk INSERT per flush"""
+
+    def __init__(self, max_batch: int = 50, max_delay_ms: float = 5.0):
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background drain task on the running event loop"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._drain_loop())
+
+    async def stop(self) -> None:
+        """Cancel the drain task"""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def submit(self, report: RescueReport) -> RescueReport:
+        """Queue a report and wait until it has been committed; its id is set on return"""
+        if self._task is None:
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((report, future))
+        await future
+        return report
+
+    async def _drain_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+
+            # Keep collecting until the batch is full or the first report has waited max_delay
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[RescueReport, asyncio.Future]]) -> None:
+        try:
+            await self._insert([report for report, _ in batch])
+        except Exception as e:
+            logger.error(f"Failed to insert batch of {len(batch)} reports: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def _insert(self, reports: List[RescueReport]) -> None:
+        async with async_session() as db:
+            await bulk_insert_reports(db, reports)
+            await db.commit()
+        await dashboard_cache.invalidate()
+
+report_batcher = ReportInsertBatcher(
+    max_batch=int(os.getenv("SUBMIT_MAX_BATCH", "50")),
+    max_delay_ms=float(os.getenv("SUBMIT_MAX_DELAY_MS", "5"))
+)
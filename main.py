@@ -1,11 +1,15 @@
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 import logging
 
-from models.database import create_db_and_tables
-from api import reports_router, admin_router
+from models.database import async_session, create_db_and_tables
+from models.repository import backfill_geohashes
+from api import reports_router, admin_router, FastJSONResponse
+from api.dashboard_cache import dashboard_cache
+from api.submit_batcher import report_batcher
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -15,6 +19,7 @@ app = FastAPI(
     title="RESQ - Disaster Relief Platform",
     description="A high-performance backend for disaster relief operations where victims report disasters and NGOs manage rescue operations",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     contact={
@@ -34,11 +39,19 @@ app.add_middleware(
 app.include_router(reports_router)
 app.include_router(admin_router)
 
+# FastAPI's built-in 422 handler always uses the stdlib JSONResponse
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request, exc):
+    return FastJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors())}
+    )
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     logger.error(f"Global exception: {str(exc)}")
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=500,
         content={"detail": "Internal server error occurred"}
     )
@@ -62,11 +75,23 @@ async def root():
 async def startup_event():
     """Initialize database and tables on startup"""
     try:
-        create_db_and_tables()
+        await create_db_and_tables()
         logger.info("Database tables created successfully")
+        # Reports stored before the geohash column was added have none yet
+        async with async_session() as db:
+            backfilled = await backfill_geohashes(db)
+        if backfilled:
+            logger.info(f"Backfilled geohash for {backfilled} reports")
     except Exception as e:
         logger.error(f"Failed to create database tables: {str(e)}")
         raise
+    report_batcher.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the single-report insert batcher and close the dashboard cache"""
+    await report_batcher.stop()
+    await dashboard_cache.close()
 
 if __name__ == "__main__":
     uvicorn.run(
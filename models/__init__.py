@@ -1,12 +1,21 @@
-from .database import engine, get_db, create_db_and_tables
-from .rescue_report import RescueReport, RescueReportCreate, RescueReportRead, RescueReportUpdate
+from .database import engine, async_session, get_db, create_db_and_tables
+from .rescue_report import DisasterType, Need, RescueReport, RescueReportCreate, RescueReportRead, RescueReportUpdate
+from .repository import bulk_insert_reports, assign_incident_ids, backfill_geohashes, aggregate_incidents, top_reports_by_incident
 
 __all__ = [
     "engine",
+    "async_session",
     "get_db", 
     "create_db_and_tables",
+    "DisasterType",
+    "Need",
     "RescueReport",
     "RescueReportCreate", 
     "RescueReportRead",
-    "RescueReportUpdate"
+    "RescueReportUpdate",
+    "bulk_insert_reports",
+    "assign_incident_ids",
+    "backfill_geohashes",
+    "aggregate_incidents",
+    "top_reports_by_incident"
 ]
\ No newline at end of file
@@ -1,18 +1,35 @@
-from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy.ext.declarative import declarative_base
-from typing import Generator
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from typing import AsyncGenerator
 from dotenv import load_dotenv
 import os
 
 load_dotenv()  
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+# Existing .env files point at the blocking drivers; swap in their asyncio counterparts
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
 
-engine = create_engine(DATABASE_URL)
+def async_database_url(url: str) -> str:
+    """Rewrite a database URL to use the asyncio driver for its backend"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend in ASYNC_DRIVERS:
+        url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return url.render_as_string(hide_password=False)
 
-def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+DATABASE_URL = async_database_url(os.getenv("DATABASE_URL"))
+
+engine = create_async_engine(DATABASE_URL)
+
+# Rows stay loaded after commit so responses can be built without another round trip
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with async_session() as session:
         yield session
 
-def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
\ No newline at end of file
+async def create_db_and_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
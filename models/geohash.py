@@ -0,0 +1,29 @@
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+def encode(lat: float, lng: float, precision: int = 9) -> str:
+    """Encode a coordinate as a geohash; nearby points share a common prefix"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    use_lng = True
+
+    # Bits alternate between longitude and latitude, five bits per base32 character
+    while len(chars) < precision:
+        value_range, value = (lng_range, lng) if use_lng else (lat_range, lat)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = bits * 2 + 1
+            value_range[0] = mid
+        else:
+            bits = bits * 2
+            value_range[1] = mid
+        use_lng = not use_lng
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
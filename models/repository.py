@@ -0,0 +1,165 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from sqlalchemy import JSON, Boolean, SmallInteger, String, TypeDecorator, func, insert, type_coerce, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.functions import FunctionElement
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Dict, List, Optional, Sequence
+
+from . import geohash
+from .rescue_report import DISASTER_TYPES, RescueReport
+
+async def bulk_insert_reports(db: AsyncSession, reports: List[RescueReport]) -> None:
+    """Insert all reports with a single INSERT ... RETURNING and copy the new ids and timestamps back"""
+    rows = [report.model_dump(exclude={"id", "timestamp"}) for report in reports]
+    if not db.get_bind().dialect.insert_executemany_returning:
+        # No RETURNING with executemany (e.g. MySQL): stamp rows here, bulk insert and read back each row's id
+        timestamp = datetime.now(timezone.utc)
+        for row in rows:
+            row["timestamp"] = timestamp
+        await db.run_sync(
+            lambda session: session.bulk_insert_mappings(RescueReport, rows, return_defaults=True)
+        )
+        for report, row in zip(reports, rows):
+            report.id = row["id"]
+            report.timestamp = timestamp
+        return
+    
+    result = await db.exec(
+        insert(RescueReport).returning(RescueReport.id, RescueReport.timestamp, sort_by_parameter_order=True),
+        params=rows
+    )
+    for report, (report_id, timestamp) in zip(reports, result.all()):
+        # Some SQLite versions return RETURNING ids with REAL affinity (1.0)
+        report.id = int(report_id)
+        report.timestamp = timestamp
+
+async def assign_incident_ids(db: AsyncSession, clustered_reports: Dict[str, List[RescueReport]]) -> None:
+    """Write changed incident ids with one executemany UPDATE keyed on the primary key"""
+    # Reports already carrying their incident id are skipped, so unchanged rows are never rewritten
+    rows = [
+        {"id": report.id, "incident_id": incident_id}
+        for incident_id, incident_reports in clustered_reports.items()
+        for report in incident_reports
+        if report.incident_id != incident_id
+    ]
+    if not rows:
+        return
+    # ORM bulk UPDATE by primary key: two parameters per execution, so no bind-parameter ceiling
+    await db.exec(update(RescueReport), params=rows)
+
+async def backfill_geohashes(db: AsyncSession, batch_size: int = 1000) -> int:
+    """Fill in the geohash of reports stored before the column existed; returns how many were updated"""
+    updated = 0
+    while True:
+        missing = (await db.exec(
+            select(RescueReport.id, RescueReport.location_lat, RescueReport.location_lng)
+            .where(RescueReport.geohash.is_(None))
+            .limit(batch_size)
+        )).all()
+        if not missing:
+            return updated
+        await db.exec(
+            update(RescueReport),
+            params=[{"id": report_id, "geohash": geohash.encode(lat, lng)} for report_id, lat, lng in missing]
+        )
+        await db.commit()
+        updated += len(missing)
+
+class array_agg_distinct(FunctionElement):
+    """array_agg(DISTINCT ...) on PostgreSQL; json_group_array(DISTINCT ...) on SQLite"""
+    type = ARRAY(String).with_variant(JSON, "sqlite")
+    inherit_cache = True
+
+@compiles(array_agg_distinct)
+def _compile_array_agg_distinct(element, compiler, **kw):
+    return f"array_agg(DISTINCT {compiler.process(element.clauses, **kw)})"
+
+@compiles(array_agg_distinct, "sqlite")
+def _compile_json_group_array_distinct(element, compiler, **kw):
+    return f"json_group_array(DISTINCT {compiler.process(element.clauses, **kw)})"
+
+class DisasterTypeCodes(TypeDecorator):
+    """Decode an aggregated array of disaster type codes back to their names"""
+    impl = ARRAY(SmallInteger)
+    cache_ok = True
+    
+    def load_dialect_impl(self, dialect):
+        return dialect.type_descriptor(JSON() if dialect.name == "sqlite" else ARRAY(SmallInteger))
+    
+    def process_result_value(self, value: Optional[List[int]], dialect) -> List[str]:
+        return [DISASTER_TYPES[code] for code in value or []]
+
+class array_contains(FunctionElement):
+    """array @> ARRAY[value] on PostgreSQL (GIN-indexed); a json_each membership test on SQLite"""
+    type = Boolean()
+    inherit_cache = True
+
+@compiles(array_contains)
+def _compile_array_contains(element, compiler, **kw):
+    array, value = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"{array} @> ARRAY[CAST({value} AS VARCHAR)]"
+
+@compiles(array_contains, "sqlite")
+def _compile_json_each_contains(element, compiler, **kw):
+    array, value = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"EXISTS (SELECT 1 FROM json_each({array}) WHERE json_each.value = {value})"
+
+async def aggregate_incidents(
+    db: AsyncSession,
+    incident_id: Optional[str] = None,
+    limit: Optional[int] = None
+) -> Sequence[Row]:
+    """Summarize verified incidents in one GROUP BY, highest priority first
+    
+    Rows carry incident_id, total_reports, priority, disaster_types, lat and lng.
+    """
+    query = (
+        select(
+            RescueReport.incident_id,
+            func.count().label("total_reports"),
+            func.max(RescueReport.priority).label("priority"),
+            type_coerce(array_agg_distinct(RescueReport.disaster_type), DisasterTypeCodes).label("disaster_types"),
+            func.avg(RescueReport.location_lat).label("lat"),
+            func.avg(RescueReport.location_lng).label("lng")
+        )
+        .where(RescueReport.is_verified == True, RescueReport.incident_id.is_not(None))
+        .group_by(RescueReport.incident_id)
+        .order_by(func.max(RescueReport.priority).desc(), func.max(RescueReport.timestamp))
+        .limit(limit)
+    )
+    if incident_id is not None:
+        query = query.where(RescueReport.incident_id == incident_id)
+    return (await db.exec(query)).all()
+
+async def top_reports_by_incident(
+    db: AsyncSession,
+    incident_ids: List[str],
+    per_incident: Optional[int] = None
+) -> Dict[str, List[RescueReport]]:
+    """Fetch each incident's verified reports, highest priority and newest first"""
+    ranked_reports = (
+        select(
+            RescueReport,
+            func.row_number().over(
+                partition_by=RescueReport.incident_id,
+                order_by=(RescueReport.priority.desc(), RescueReport.timestamp.desc())
+            ).label("report_rank")
+        )
+        .where(RescueReport.is_verified == True, RescueReport.incident_id.in_(incident_ids))
+        .subquery()
+    )
+    ranked_report = aliased(RescueReport, ranked_reports)
+    query = select(ranked_report).order_by(ranked_reports.c.incident_id, ranked_reports.c.report_rank)
+    if per_incident is not None:
+        # Ranked inside the database so only the rendered reports are transferred
+        query = query.where(ranked_reports.c.report_rank <= per_incident)
+    
+    reports_by_incident = defaultdict(list)
+    for report in await db.exec(query):
+        reports_by_incident[report.incident_id].append(report)
+    return reports_by_incident
@@ -1,12 +1,33 @@
-from sqlmodel import SQLModel, Field, Column, String, Float, Integer, DateTime, Boolean, Text, JSON
+from sqlmodel import SQLModel, Field, Column, String, Float, Integer, DateTime, Boolean, Text, JSON, Index
+from sqlalchemy import SmallInteger, TypeDecorator, func, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional, get_args
+
+# Stored as the position in this list, so new types must only ever be appended
+DisasterType = Literal[
+    "flood", "earthquake", "fire", "storm", "tornado", "hurricane", "landslide", "collapse", "spill", "other"
+]
+DISASTER_TYPES = get_args(DisasterType)
+Need = Literal["food", "water", "medical", "shelter", "rescue", "other"]
+
+class DisasterTypeCode(TypeDecorator):
+    """Store a DisasterType as a 2-byte SMALLINT code"""
+    impl = SmallInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[int]:
+        return None if value is None else DISASTER_TYPES.index(value)
+    
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[str]:
+        return None if value is None else DISASTER_TYPES[value]
 
 class RescueReportBase(SQLModel):
-    location_lat: float = Field(index=True)
-    location_lng: float = Field(index=True)
-    disaster_type: str = Field(max_length=100)
-    needs: List[str] = Field(default_factory=list, sa_column=Column(JSON))
+    location_lat: float
+    location_lng: float
+    disaster_type: DisasterType = Field(sa_column=Column(DisasterTypeCode, nullable=False, index=True))
+    # Native text[] on PostgreSQL (GIN-indexed for containment filters); JSON on SQLite
+    needs: List[str] = Field(default_factory=list, sa_column=Column(ARRAY(String).with_variant(JSON, "sqlite")))
     priority: int = Field(ge=1, le=5)
     title: str = Field(max_length=200, nullable=False)
     description: Optional[str] = Field(default=None, max_length=1000)
@@ -14,25 +35,29 @@ class RescueReportBase(SQLModel):
     incident_id: Optional[str] = Field(default=None, max_length=50)
 
 class RescueReport(RescueReportBase, table=True):
-    id: Optional[int] = Field(default=None, primary_key=True)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    # Dashboard and incident queries filter on is_verified, group by incident_id and sort by priority/timestamp
+    __table_args__ = (
+        Index("ix_rescue_verified_incident", "is_verified", "incident_id", "priority", "timestamp"),
+        # Incident lookups by id; unclustered reports (the bulk of pending ones) stay out of the index
+        Index(
+            "ix_rescue_incident",
+            "incident_id",
+            postgresql_where=text("incident_id IS NOT NULL"),
+            sqlite_where=text("incident_id IS NOT NULL")
+        ),
+        Index("ix_rescue_needs", "needs", postgresql_using="gin"),
+        # Bounding-box filters use both coordinates; geohash prefixes (LIKE 'dr5r%') narrow by area
+        Index("ix_rescue_location", "location_lat", "location_lng"),
+        Index("ix_rescue_geohash", "geohash", postgresql_ops={"geohash": "varchar_pattern_ops"}),
+    )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "location_lat": 40.7128,
-                "location_lng": -74.0060,
-                "disaster_type": "flood",
-                "needs": ["food", "water", "medical"],
-                "priority": 5,
-                "title": "Flood in downtown area",
-                "description": "Multiple buildings flooded, people trapped",
-                "is_verified": False,
-                "incident_id": None,
-                "timestamp": "2023-12-25T11:43:00"
-            }
-        }
+    id: Optional[int] = Field(default=None, primary_key=True)
+    geohash: Optional[str] = Field(default=None, max_length=9)
+    # Filled in by the database on insert and read back with RETURNING
+    timestamp: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 class RescueReportCreate(RescueReportBase):
     pass
@@ -6,7 +6,14 @@ from .report_schemas import (
     DashboardResponse,
     BatchSyncResponse,
     ValidationResponse,
-    ErrorResponse
+    ErrorResponse,
+    SUBMIT_ADAPTER,
+    BATCH_ADAPTER,
+    RESPONSE_ADAPTER,
+    REPORT_LIST_ADAPTER,
+    INCIDENT_ADAPTER,
+    DASHBOARD_ADAPTER,
+    BATCH_RESPONSE_ADAPTER
 )
 __all__ = [
     "ReportSubmitRequest",
@@ -16,5 +23,12 @@ __all__ = [
     "DashboardResponse",
     "BatchSyncResponse",
     "ValidationResponse",
-    "ErrorResponse"
+    "ErrorResponse",
+    "SUBMIT_ADAPTER",
+    "BATCH_ADAPTER",
+    "RESPONSE_ADAPTER",
+    "REPORT_LIST_ADAPTER",
+    "INCIDENT_ADAPTER",
+    "DASHBOARD_ADAPTER",
+    "BATCH_RESPONSE_ADAPTER"
 ]
\ No newline at end of file
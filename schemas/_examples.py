@@ -0,0 +1,24 @@
+# OpenAPI request body examples, referenced from the schema model_config
+EXAMPLES = {
+    "report_submit": {
+        "location_lat": 40.7128,
+        "location_lng": -74.0060,
+        "disaster_type": "flood",
+        "needs": ["food", "water", "medical"],
+        "priority": 5,
+        "title": "Flood in downtown area",
+        "description": "Multiple buildings flooded, people trapped"
+    },
+    "batch_sync": {
+        "reports": [
+            {
+                "location_lat": 40.7128,
+                "location_lng": -74.0060,
+                "disaster_type": "flood",
+                "needs": ["food", "water"],
+                "priority": 5,
+                "title": "Flood near main street"
+            }
+        ]
+    }
+}
@@ -1,57 +1,48 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter, field_validator
+from typing import Annotated, FrozenSet, List, Dict, Any, Optional
 from datetime import datetime
 
+from models.rescue_report import DisasterType, Need
+from ._examples import EXAMPLES
+
+# Report field types shared by submissions and responses, declared once
+Latitude = Annotated[float, Field(ge=-90, le=90, description="Latitude coordinate")]
+Longitude = Annotated[float, Field(ge=-180, le=180, description="Longitude coordinate")]
+Priority = Annotated[int, Field(ge=1, le=5, description="Priority level (1-5, 5 being highest)")]
+Title = Annotated[str, Field(min_length=5, max_length=200)]
+Description = Annotated[Optional[str], Field(max_length=1000)]
+# Submissions may use any casing ("Flood"); stored and returned in lowercase
+SubmittedDisasterType = Annotated[DisasterType, BeforeValidator(lambda v: v.lower() if isinstance(v, str) else v)]
+
 class ReportSubmitRequest(BaseModel):
-    location_lat: float = Field(..., ge=-90, le=90, description="Latitude coordinate")
-    location_lng: float = Field(..., ge=-180, le=180, description="Longitude coordinate")
-    disaster_type: str = Field(..., min_length=1, max_length=100)
-    needs: List[str] = Field(default_factory=list, description="List of immediate needs")
-    priority: int = Field(..., ge=1, le=5, description="Priority level (1-5, 5 being highest)")
-    title: str = Field(..., min_length=5, max_length=200)
-    description: Optional[str] = Field(None, max_length=1000)
+    location_lat: Latitude
+    location_lng: Longitude
+    disaster_type: SubmittedDisasterType
+    needs: FrozenSet[Need] = Field(default_factory=frozenset, description="Set of immediate needs")
+    priority: Priority
+    title: Title
+    description: Description = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "location_lat": 40.7128,
-                "location_lng": -74.0060,
-                "disaster_type": "flood",
-                "needs": ["food", "water", "medical"],
-                "priority": 5,
-                "title": "Flood in downtown area",
-                "description": "Multiple buildings flooded, people trapped"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": EXAMPLES["report_submit"]})
+
+ReportBatch = Annotated[List[ReportSubmitRequest], Field(min_length=1, max_length=100)]
 
 class BatchSyncRequest(BaseModel):
-    reports: List[ReportSubmitRequest] = Field(..., min_items=1, max_items=100)
+    reports: ReportBatch
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "reports": [
-                    {
-                        "location_lat": 40.7128,
-                        "location_lng": -74.0060,
-                        "disaster_type": "flood",
-                        "needs": ["food", "water"],
-                        "priority": 5,
-                        "title": "Flood near main street"
-                    }
-                ]
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": EXAMPLES["batch_sync"]})
 
+# Response-only models are built with model_construct; defer_build only skips each class's own
+# validator, since the adapters below and response_model fields still compile the schemas at import
 class ReportResponse(BaseModel):
     id: int
-    location_lat: float
-    location_lng: float
-    disaster_type: str
+    location_lat: Latitude
+    location_lng: Longitude
+    disaster_type: DisasterType
     needs: List[str]
-    priority: int
-    title: str
-    description: Optional[str]
+    priority: Priority
+    title: Title
+    description: Description
     is_verified: bool
     incident_id: Optional[str]
     timestamp: datetime
@@ -61,8 +52,27 @@ class ReportResponse(BaseModel):
     def default_title(cls, v: Optional[str]) -> str:
         return v or "Untitled incident"
     
-    class Config:
-        from_attributes = True
+    # Trust boundary: client payloads are validated on the way in (ReportSubmitRequest,
+    # BatchSyncRequest); rows read back from the database are already typed, so responses
+    # built from them skip pydantic-core validation entirely.
+    @classmethod
+    def from_orm_fast(cls, row: Any) -> "ReportResponse":
+        """Build from a trusted RescueReport row without running validation"""
+        return cls.model_construct(
+            id=row.id,
+            location_lat=row.location_lat,
+            location_lng=row.location_lng,
+            disaster_type=row.disaster_type,
+            needs=row.needs,
+            priority=row.priority,
+            title=cls.default_title(row.title),
+            description=row.description,
+            is_verified=row.is_verified,
+            incident_id=row.incident_id,
+            timestamp=row.timestamp
+        )
+    
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True, extra="ignore")
 
 class IncidentSummary(BaseModel):
     incident_id: str
@@ -72,6 +82,8 @@ class IncidentSummary(BaseModel):
     disaster_types: List[str]
     location: Dict[str, float]
     reports: List[ReportResponse]
+    
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore")
 
 class DashboardResponse(BaseModel):
     incidents: List[IncidentSummary]
@@ -79,6 +91,8 @@ class DashboardResponse(BaseModel):
     total_incidents: int
     verified_reports: int
     pending_verification: int
+    
+    model_config = ConfigDict(defer_build=True)
 
 class BatchSyncResponse(BaseModel):
     success: bool
@@ -86,6 +100,8 @@ class BatchSyncResponse(BaseModel):
     processed_reports: int
     incidents_created: int
     reports_with_ids: List[Dict[str, Any]]
+    
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="ignore")
 
 class ValidationResponse(BaseModel):
     is_likely_authentic: bool
@@ -93,7 +109,20 @@ class ValidationResponse(BaseModel):
     matching_news: Optional[str]
     fake_indicators: List[bool]
     fake_score: float
+    
+    model_config = ConfigDict(defer_build=True)
 
 class ErrorResponse(BaseModel):
     detail: str
     error_code: Optional[str] = None
+    
+    model_config = ConfigDict(defer_build=True)
+
+# Built once at import so every request reuses the same compiled validator/serializer
+SUBMIT_ADAPTER = TypeAdapter(ReportSubmitRequest)
+BATCH_ADAPTER = TypeAdapter(BatchSyncRequest)
+RESPONSE_ADAPTER = TypeAdapter(ReportResponse)
+REPORT_LIST_ADAPTER = TypeAdapter(List[ReportResponse])
+INCIDENT_ADAPTER = TypeAdapter(IncidentSummary)
+DASHBOARD_ADAPTER = TypeAdapter(DashboardResponse)
+BATCH_RESPONSE_ADAPTER = TypeAdapter(BatchSyncResponse)